@@ -17,14 +17,26 @@ Requirements:
 Usage:
     python verification_daemon.py --config config.json
     python verification_daemon.py --node http://localhost:8080 --session <session_id>
+    python verification_daemon.py --config config.json --workers 4 --spawn
+    python verification_daemon.py --config config.json --once --trace traces --profile profiles
+    python verification_daemon.py --config config.json --once --record cycle.jsonl.gz
+    python verification_daemon.py --config config.json --once --replay cycle.jsonl.gz
 """
 
 import argparse
+import cProfile
+import gzip
 import json
 import logging
+import multiprocessing
 import os
+import socket
+import sqlite3
 import sys
+import threading
 import time
+import zlib
+from contextlib import closing, contextmanager
 from datetime import datetime
 from typing import Optional
 
@@ -50,20 +62,33 @@ DEFAULT_CONFIG = {
         "L3": 100000
     },
     "log_file": "verification_daemon.log",
-    "log_level": "INFO"
+    "log_level": "INFO",
+    "workers": 1,
+    "worker_index": 0,
+    "coordination_db": "verification_coordination.db",
+    "lease_ttl": 900,  # 15 minutes
+    "trace_dir": None,
+    "profile_dir": None,
+    "record_cassette": None,
+    "replay_cassette": None,
+    "replay_latency": 0.0  # seconds added to each replayed call
 }
 
 # =============================================================================
 # LOGGING SETUP
 # =============================================================================
 
-def setup_logging(log_file: str, log_level: str):
+def setup_logging(log_file: str, log_level: str, worker_index: Optional[int] = None):
     """Configure logging to file and console."""
     level = getattr(logging, log_level.upper(), logging.INFO)
     
+    log_format = '%(asctime)s [%(levelname)s] %(message)s'
+    if worker_index is not None:
+        log_format = f'%(asctime)s [%(levelname)s] [worker {worker_index}] %(message)s'
+    
     logging.basicConfig(
         level=level,
-        format='%(asctime)s [%(levelname)s] %(message)s',
+        format=log_format,
         handlers=[
             logging.FileHandler(log_file),
             logging.StreamHandler(sys.stdout)
@@ -72,6 +97,56 @@ def setup_logging(log_file: str, log_level: str):
     return logging.getLogger(__name__)
 
 
+# =============================================================================
+# CYCLE TRACING
+# =============================================================================
+
+class CycleTracer:
+    """Records timed spans as Chrome trace events (chrome://tracing, Perfetto)."""
+    
+    def __init__(self, enabled: bool = False, process_name: str = "verification-daemon"):
+        self.enabled = enabled
+        self.process_name = process_name
+        self.events = []
+    
+    @contextmanager
+    def span(self, name: str, category: str, **args):
+        """Record the enclosed block as a complete ("X") event."""
+        if not self.enabled:
+            yield
+            return
+        
+        ts = time.time() * 1e6
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": ts,
+                "dur": (time.perf_counter() - start) * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident()
+            }
+            if args:
+                event["args"] = args
+            self.events.append(event)
+    
+    def save(self, path: str):
+        """Write recorded events to a trace file and start a new trace."""
+        metadata = {
+            "name": "process_name",
+            "ph": "M",
+            "pid": os.getpid(),
+            "args": {"name": self.process_name}
+        }
+        with open(path, 'w') as f:
+            json.dump({"traceEvents": [metadata] + self.events, "displayTimeUnit": "ms"}, f)
+        self.events = []
+
+
 # =============================================================================
 # NEXUS API CLIENT
 # =============================================================================
@@ -79,23 +154,27 @@ def setup_logging(log_file: str, log_level: str):
 class NexusClient:
     """Client for interacting with local Nexus node API."""
     
-    def __init__(self, node_url: str, session_id: Optional[str] = None):
+    def __init__(self, node_url: str, session_id: Optional[str] = None,
+                 tracer: Optional[CycleTracer] = None):
         self.node_url = node_url.rstrip('/')
         self.session_id = session_id
+        self.tracer = tracer or CycleTracer()
+        self.call_counts = {}
         self.logger = logging.getLogger(__name__)
     
     def request(self, endpoint: str, params: dict = None) -> dict:
         """Make a POST request to the Nexus API."""
-        url = f"{self.node_url}/{endpoint}"
-        headers = {"Content-Type": "application/json"}
-        
         body = params or {}
+        # Only the target name is traced, never credentials
+        trace_args = {"target": body["name"]} if "name" in body else {}
         if self.session_id:
             body["session"] = self.session_id
         
+        self.call_counts[endpoint] = self.call_counts.get(endpoint, 0) + 1
+        
         try:
-            response = requests.post(url, json=body, headers=headers, timeout=30)
-            data = response.json()
+            with self.tracer.span(endpoint, "api", **trace_args):
+                data = self.send(endpoint, body)
             
             if "error" in data:
                 raise NexusAPIError(data["error"].get("message", "Unknown error"))
@@ -105,6 +184,22 @@ class NexusClient:
         except requests.exceptions.RequestException as e:
             raise NexusAPIError(f"Request failed: {e}")
     
+    def send(self, endpoint: str, body: dict) -> dict:
+        """POST a request body to the node and return the decoded JSON response."""
+        url = f"{self.node_url}/{endpoint}"
+        headers = {"Content-Type": "application/json"}
+        
+        response = requests.post(url, json=body, headers=headers, timeout=30)
+        return response.json()
+    
+    def end_cycle(self):
+        """Hook called after each processing cycle."""
+        pass
+    
+    def close(self):
+        """Release client resources."""
+        pass
+    
     def login(self, username: str, password: str, pin: str) -> str:
         """Login to create a session."""
         result = self.request("sessions/create/local", {
@@ -192,6 +287,237 @@ class NexusAPIError(Exception):
     pass
 
 
+# =============================================================================
+# API RECORD / REPLAY
+# =============================================================================
+
+def cassette_key(endpoint: str, params: dict) -> str:
+    """Match key for a recorded call: endpoint plus target name or query."""
+    params = {k: v for k, v in params.items() if k != "session"}
+    # Writes carry fresh timestamps, so match on the target name alone
+    target = params.get("name")
+    if target is None:
+        target = json.dumps(params, sort_keys=True)
+    return f"{endpoint} {target}"
+
+
+class RecordingNexusClient(NexusClient):
+    """Nexus client that writes every call and response to a gzipped JSON-lines cassette."""
+    
+    def __init__(self, node_url: str, cassette_path: str, session_id: Optional[str] = None,
+                 tracer: Optional[CycleTracer] = None):
+        super().__init__(node_url, session_id, tracer)
+        self.cassette_path = cassette_path
+        self.cassette = gzip.open(cassette_path, "wt", encoding="utf-8")
+    
+    def send(self, endpoint: str, body: dict) -> dict:
+        """Forward to the node and record the exchange."""
+        # Session calls carry credentials and are not needed for replay
+        if endpoint.startswith("sessions/"):
+            return super().send(endpoint, body)
+        
+        entry = {
+            "endpoint": endpoint,
+            "params": {k: v for k, v in body.items() if k != "session"}
+        }
+        start = time.perf_counter()
+        
+        try:
+            entry["response"] = super().send(endpoint, body)
+            return entry["response"]
+        except requests.exceptions.RequestException as e:
+            entry["exception"] = str(e)
+            raise
+        finally:
+            entry["elapsed"] = time.perf_counter() - start
+            if "response" in entry or "exception" in entry:
+                self.cassette.write(json.dumps(entry) + "\n")
+    
+    def end_cycle(self):
+        """Finish the cycle's gzip member, so a killed run keeps completed cycles."""
+        self.cassette.close()
+        self.cassette = gzip.open(self.cassette_path, "at", encoding="utf-8")
+    
+    def close(self):
+        """Finish the cassette file."""
+        self.cassette.close()
+        self.logger.info(f"Cassette written to {self.cassette_path}")
+
+
+class ReplayNexusClient(NexusClient):
+    """Nexus client that serves responses from a recorded cassette instead of a node."""
+    
+    WRITE_ENDPOINTS = ("assets/create/asset", "assets/update/asset")
+    
+    def __init__(self, cassette_path: str, latency: float = 0.0,
+                 tracer: Optional[CycleTracer] = None):
+        super().__init__(f"replay://{cassette_path}", None, tracer)
+        self.latency = latency
+        self.misses = 0
+        self.entries = {}
+        self.positions = {}
+        
+        try:
+            with gzip.open(cassette_path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    key = cassette_key(entry["endpoint"], entry["params"])
+                    self.entries.setdefault(key, []).append(entry)
+        except (EOFError, OSError, zlib.error, json.JSONDecodeError) as e:
+            # A recording that was killed mid-cycle ends in a truncated member
+            self.logger.warning(f"Cassette {cassette_path} is truncated, replaying calls before it: {e}")
+        
+        self.logger.info(
+            f"Loaded {sum(len(e) for e in self.entries.values())} calls from {cassette_path}"
+        )
+    
+    def send(self, endpoint: str, body: dict) -> dict:
+        """Return the next recorded response for this call."""
+        if self.latency:
+            time.sleep(self.latency)
+        
+        key = cassette_key(endpoint, body)
+        entries = self.entries.get(key)
+        
+        if not entries:
+            self.misses += 1
+            self.logger.debug(f"Not in cassette: {key}")
+            # Unrecorded writes succeed; unrecorded reads look like missing objects
+            if endpoint in self.WRITE_ENDPOINTS:
+                return {"result": {}}
+            return {"error": {"message": f"Not in cassette: {key}"}}
+        
+        # Responses are served in recorded order; the last one repeats
+        position = self.positions.get(key, 0)
+        self.positions[key] = position + 1
+        entry = entries[min(position, len(entries) - 1)]
+        
+        if "exception" in entry:
+            raise requests.exceptions.RequestException(entry["exception"])
+        return entry["response"]
+
+
+# =============================================================================
+# WORKER COORDINATION
+# =============================================================================
+
+def namespace_partition(namespace: str, workers: int) -> int:
+    """Map a namespace to the worker owning its hash range."""
+    # crc32 is stable across processes and hosts, unlike the salted hash()
+    return (zlib.crc32(namespace.encode("utf-8")) * workers) >> 32
+
+
+class CoordinationStore:
+    """SQLite-backed leader lease and tier decision queue for partitioned workers."""
+    
+    LEASE_NAME = "leader"
+    
+    def __init__(self, path: str, lease_ttl: int):
+        self.path = path
+        self.lease_ttl = lease_ttl
+        self.logger = logging.getLogger(__name__)
+        
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS lease ("
+                "name TEXT PRIMARY KEY, holder TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS decisions ("
+                "namespace TEXT PRIMARY KEY, current_tier TEXT NOT NULL, "
+                "eligible_tier TEXT NOT NULL, balance REAL NOT NULL, "
+                "worker TEXT NOT NULL, submitted REAL NOT NULL)"
+            )
+    
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode; write paths take the lock with BEGIN IMMEDIATE
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+    
+    # -------------------------------------------------------------------------
+    # Leader Lease
+    # -------------------------------------------------------------------------
+    
+    def acquire_lease(self, holder: str) -> bool:
+        """Acquire or renew the leader lease. Returns True if held by holder."""
+        now = time.time()
+        
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT holder, expires FROM lease WHERE name = ?",
+                    (self.LEASE_NAME,)
+                ).fetchone()
+                
+                if row is not None and row[0] != holder and row[1] > now:
+                    conn.execute("COMMIT")
+                    return False
+                
+                conn.execute(
+                    "INSERT OR REPLACE INTO lease (name, holder, expires) VALUES (?, ?, ?)",
+                    (self.LEASE_NAME, holder, now + self.lease_ttl)
+                )
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+        
+        if row is None or row[0] != holder:
+            self.logger.info(f"Acquired leader lease as {holder}")
+        return True
+    
+    def release_lease(self, holder: str):
+        """Release the leader lease if held by holder."""
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "DELETE FROM lease WHERE name = ? AND holder = ?",
+                (self.LEASE_NAME, holder)
+            )
+    
+    # -------------------------------------------------------------------------
+    # Decision Queue
+    # -------------------------------------------------------------------------
+    
+    def submit_decision(self, namespace: str, current_tier: str, eligible_tier: str,
+                        balance: float, worker: str):
+        """Queue a tier decision for the leader. Newer decisions replace older ones."""
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO decisions "
+                "(namespace, current_tier, eligible_tier, balance, worker, submitted) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, current_tier, eligible_tier, balance, worker, time.time())
+            )
+    
+    def take_decisions(self) -> list:
+        """Remove and return all queued tier decisions."""
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = conn.execute(
+                    "SELECT namespace, current_tier, eligible_tier, balance, worker "
+                    "FROM decisions ORDER BY submitted"
+                ).fetchall()
+                conn.execute("DELETE FROM decisions")
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+        
+        return [
+            {
+                "namespace": row[0],
+                "current_tier": row[1],
+                "eligible_tier": row[2],
+                "balance": row[3],
+                "worker": row[4]
+            }
+            for row in rows
+        ]
+
+
 # =============================================================================
 # VERIFICATION DAEMON
 # =============================================================================
@@ -199,29 +525,55 @@ class NexusAPIError(Exception):
 class VerificationDaemon:
     """Main daemon class for processing verifications."""
     
-    def __init__(self, client: NexusClient, config: dict):
+    def __init__(self, client: NexusClient, config: dict,
+                 coordination: Optional[CoordinationStore] = None,
+                 tracer: Optional[CycleTracer] = None):
         self.client = client
         self.config = config
         self.namespace = config["distordia_namespace"]
         self.thresholds = config["tier_thresholds"]
         self.max_entries = config["asset_max_entries"]
         self.logger = logging.getLogger(__name__)
+        
+        # Per-cycle diagnostics, written to these directories when set
+        self.tracer = tracer or CycleTracer()
+        self.trace_dir = config.get("trace_dir")
+        self.profile_dir = config.get("profile_dir")
+        
+        # Partitioned mode: each worker audits one hash range of namespaces,
+        # and only the lease holder writes to the registries
+        self.workers = config.get("workers", 1)
+        self.worker_index = config.get("worker_index", 0)
+        self.coordination = coordination
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{self.worker_index}"
+        self.is_leader = coordination is None
+        
+        # Namespaces already given a tier decision in the current cycle
+        self.decided = set()
+        
+        # Suffix keeping dispute IDs unique when several share a millisecond
+        self.dispute_sequence = 0
     
     # -------------------------------------------------------------------------
     # Request Processing
     # -------------------------------------------------------------------------
     
-    def process_verification_requests(self):
-        """Process pending verification requests."""
-        self.logger.info("Processing verification requests...")
+    def process_pending_requests(self):
+        """Process pending verification and dispute requests per namespace."""
+        self.logger.info("Processing verification and dispute requests...")
         
-        requests = self.get_pending_requests("verification-request")
+        grouped = self.group_pending_by_namespace()
         
-        for req in requests:
+        for namespace, pending in grouped.items():
+            if not self.holds_lease():
+                break
             try:
-                self.process_single_request(req)
+                with self.tracer.span(namespace, "namespace", phase="requests"):
+                    self.process_namespace_requests(
+                        namespace, pending["requests"], pending["disputes"]
+                    )
             except Exception as e:
-                self.logger.error(f"Failed to process request {req.get('id')}: {e}")
+                self.logger.error(f"Failed to process requests for {namespace}: {e}")
     
     def get_pending_requests(self, request_type: str) -> list:
         """Get all pending requests of a specific type."""
@@ -234,92 +586,108 @@ class VerificationDaemon:
         
         return pending
     
-    def process_single_request(self, request: dict):
-        """Process a single verification request."""
-        namespace = request.get("namespace")
-        requested_tier = request.get("tier", "L1")
-        request_id = request.get("address") or request.get("name")
+    def group_pending_by_namespace(self) -> dict:
+        """Group pending verification and dispute requests by namespace."""
+        grouped = {}
+        
+        for request_type, key in [("dispute-request", "disputes"),
+                                  ("verification-request", "requests")]:
+            for req in self.get_pending_requests(request_type):
+                pending = grouped.setdefault(
+                    req.get("namespace"), {"requests": [], "disputes": []}
+                )
+                pending[key].append(req)
+        
+        return grouped
+    
+    def process_namespace_requests(self, namespace: str, requests: list, disputes: list):
+        """Apply disputes, then make one tier decision for all requests of a namespace."""
+        self.logger.info(
+            f"Processing {namespace}: {len(requests)} requests, {len(disputes)} disputes"
+        )
+        
+        # Disputes first, so the decision sees their penalties
+        if disputes:
+            self.add_disputes(namespace, [
+                (float(d.get("penalty", 0)), d.get("reason", ""), d.get("address") or d.get("name"))
+                for d in disputes
+            ])
+            self.update_request_statuses(
+                [d.get("address") or d.get("name") for d in disputes],
+                "registered",
+                "Dispute registered"
+            )
+            self.logger.info(f"✓ {len(disputes)} disputes registered against {namespace}")
+        
+        # Skip this namespace in the audit later in the cycle
+        self.decided.add(namespace)
+        
+        if not requests:
+            self.audit_single_namespace(namespace)
+            return
         
-        self.logger.info(f"Processing request for {namespace} -> {requested_tier}")
+        request_ids = [r.get("address") or r.get("name") for r in requests]
         
         # Check namespace exists
         ns_info = self.client.get_namespace_info(namespace)
         if not ns_info:
-            self.update_request_status(request_id, "rejected", "Namespace not found")
+            self.update_request_statuses(request_ids, "rejected", "Namespace not found")
+            self.audit_single_namespace(namespace)
             return
         
-        # Check DIST balance
-        balance = self.client.get_verification_balance(namespace)
-        penalties = self.get_penalties_for_namespace(namespace)
-        effective_balance = max(0, balance - penalties)
-        
-        # Determine eligible tier
-        eligible_tier = self.calculate_eligible_tier(effective_balance)
+        balance, eligible_tier = self.evaluate_namespace(namespace)
         
-        # Check if requested tier is allowed
+        # Approve every request the balance covers; the highest one wins
         tier_order = {"L0": 0, "L1": 1, "L2": 2, "L3": 3}
-        if tier_order.get(eligible_tier, 0) < tier_order.get(requested_tier, 0):
-            self.update_request_status(
-                request_id, 
-                "rejected", 
-                f"Insufficient balance. Eligible for {eligible_tier}, requested {requested_tier}"
-            )
+        approved = []
+        final_tier = None
+        
+        for req, request_id in zip(requests, request_ids):
+            requested_tier = req.get("tier", "L1")
+            if tier_order.get(eligible_tier, 0) < tier_order.get(requested_tier, 0):
+                self.update_request_status(
+                    request_id,
+                    "rejected",
+                    f"Insufficient balance. Eligible for {eligible_tier}, requested {requested_tier}"
+                )
+                continue
+            
+            approved.append(request_id)
+            if final_tier is None or tier_order.get(requested_tier, 0) > tier_order.get(final_tier, 0):
+                final_tier = requested_tier
+        
+        if not approved:
+            # Nothing granted; the audit skips decided namespaces, so downgrade here
+            current_tier = self.get_current_tier(namespace)
+            if tier_order.get(eligible_tier, 0) < tier_order.get(current_tier, 0):
+                self.apply_tier_decision(namespace, current_tier, eligible_tier, balance)
             return
         
         # Add to verified list
-        self.add_to_verified(namespace, ns_info.get("address"), requested_tier, balance)
+        self.add_to_verified(namespace, ns_info.get("address"), final_tier, balance)
         
-        # Update request status
-        self.update_request_status(request_id, "approved", f"Verified as {requested_tier}")
+        # Update request statuses
+        self.update_request_statuses(approved, "approved", f"Verified as {final_tier}")
         
-        self.logger.info(f"✓ {namespace} verified as {requested_tier}")
+        self.logger.info(f"✓ {namespace} verified as {final_tier}")
     
     def update_request_status(self, request_id: str, status: str, message: str):
         """Update the status of a request asset."""
-        try:
-            self.client.update_asset(request_id, {
-                "status": status,
-                "message": message,
-                "processed": datetime.utcnow().isoformat() + "Z"
-            })
-        except NexusAPIError as e:
-            self.logger.error(f"Failed to update request status: {e}")
+        self.update_request_statuses([request_id], status, message)
     
-    # -------------------------------------------------------------------------
-    # Dispute Processing
-    # -------------------------------------------------------------------------
-    
-    def process_dispute_requests(self):
-        """Process pending dispute requests."""
-        self.logger.info("Processing dispute requests...")
-        
-        requests = self.get_pending_requests("dispute-request")
+    def update_request_statuses(self, request_ids: list, status: str, message: str):
+        """Update the status of several request assets with one timestamp."""
+        processed = datetime.utcnow().isoformat() + "Z"
         
-        for req in requests:
+        for request_id in request_ids:
             try:
-                self.process_dispute(req)
-            except Exception as e:
-                self.logger.error(f"Failed to process dispute {req.get('id')}: {e}")
-    
-    def process_dispute(self, dispute: dict):
-        """Process a single dispute request."""
-        namespace = dispute.get("namespace")
-        penalty = float(dispute.get("penalty", 0))
-        reason = dispute.get("reason", "")
-        dispute_id = dispute.get("address") or dispute.get("name")
-        
-        self.logger.info(f"Processing dispute against {namespace}: {penalty} DIST")
-        
-        # Add to disputes registry
-        self.add_dispute(namespace, penalty, reason, dispute_id)
-        
-        # Update request status
-        self.update_request_status(dispute_id, "registered", "Dispute registered")
-        
-        # Re-evaluate namespace tier
-        self.audit_single_namespace(namespace)
-        
-        self.logger.info(f"✓ Dispute registered against {namespace}")
+                self.client.update_asset(request_id, {
+                    "status": status,
+                    "message": message,
+                    "processed": processed
+                })
+            except NexusAPIError as e:
+                self.logger.error(f"Failed to update request status: {e}")
     
     # -------------------------------------------------------------------------
     # Balance Auditing
@@ -329,7 +697,7 @@ class VerificationDaemon:
         """Audit all verified namespaces for balance changes."""
         self.logger.info("Auditing all verified namespaces...")
         
-        stats = {"valid": 0, "updated": 0, "revoked": 0}
+        stats = {"valid": 0, "updated": 0, "revoked": 0, "queued": 0}
         
         for tier in ["L3", "L2", "L1"]:
             verified = self.get_verified_for_tier(tier)
@@ -337,14 +705,18 @@ class VerificationDaemon:
             for entry in verified:
                 namespace = entry.get("namespace")
                 try:
-                    result = self.audit_single_namespace(namespace, tier)
+                    if not self.owns_namespace(namespace) or namespace in self.decided:
+                        continue
+                    with self.tracer.span(namespace, "namespace", phase="audit", tier=tier):
+                        result = self.audit_single_namespace(namespace, tier)
                     stats[result] += 1
                 except Exception as e:
                     self.logger.error(f"Failed to audit {namespace}: {e}")
         
         self.logger.info(
             f"Audit complete: {stats['valid']} valid, "
-            f"{stats['updated']} updated, {stats['revoked']} revoked"
+            f"{stats['updated']} updated, {stats['revoked']} revoked, "
+            f"{stats['queued']} sent to leader"
         )
         
         return stats
@@ -357,13 +729,7 @@ class VerificationDaemon:
         if current_tier == "L0":
             return "valid"
         
-        # Check current balance
-        balance = self.client.get_verification_balance(namespace)
-        penalties = self.get_penalties_for_namespace(namespace)
-        effective_balance = max(0, balance - penalties)
-        
-        # Determine eligible tier
-        eligible_tier = self.calculate_eligible_tier(effective_balance)
+        balance, eligible_tier = self.evaluate_namespace(namespace)
         
         tier_order = {"L0": 0, "L1": 1, "L2": 2, "L3": 3}
         current_order = tier_order.get(current_tier, 0)
@@ -372,7 +738,19 @@ class VerificationDaemon:
         if eligible_order >= current_order:
             return "valid"
         
-        # Need to update/revoke
+        # Workers hand registry writes to the lease holder
+        if not self.holds_lease():
+            self.coordination.submit_decision(
+                namespace, current_tier, eligible_tier, balance, self.worker_id
+            )
+            self.logger.info(f"→ {namespace} {current_tier} -> {eligible_tier} sent to leader")
+            return "queued"
+        
+        return self.apply_tier_decision(namespace, current_tier, eligible_tier, balance)
+    
+    def apply_tier_decision(self, namespace: str, current_tier: str,
+                            eligible_tier: str, balance: float) -> str:
+        """Downgrade or revoke a namespace in the registries."""
         self.remove_from_tier(namespace, current_tier)
         
         if eligible_tier != "L0":
@@ -384,6 +762,20 @@ class VerificationDaemon:
             self.logger.info(f"✗ {namespace} revoked from {current_tier}")
             return "revoked"
     
+    def evaluate_namespace(self, namespace: str) -> tuple:
+        """Return the DIST balance and the tier it qualifies for after penalties."""
+        balance = self.client.get_verification_balance(namespace)
+        penalties = self.get_penalties_for_namespace(namespace)
+        effective_balance = max(0, balance - penalties)
+        
+        return balance, self.calculate_eligible_tier(effective_balance)
+    
+    def owns_namespace(self, namespace: str) -> bool:
+        """Check whether this worker's hash range covers a namespace."""
+        if self.workers <= 1:
+            return True
+        return namespace_partition(namespace, self.workers) == self.worker_index
+    
     def calculate_eligible_tier(self, effective_balance: float) -> str:
         """Calculate eligible tier based on effective balance."""
         if effective_balance >= self.thresholds["L3"]:
@@ -565,79 +957,193 @@ class VerificationDaemon:
         
         return total
     
-    def add_dispute(self, namespace: str, penalty: float, reason: str, source_id: str):
-        """Add a dispute to the disputes registry."""
-        # Find target asset
+    def add_disputes(self, namespace: str, disputes: list):
+        """Add (penalty, reason, source_id) disputes to the registry, filling assets in order."""
+        created = datetime.utcnow().isoformat() + "Z"
+        stamp = int(time.time() * 1000)
+        
+        new_entries = []
+        for penalty, reason, source_id in disputes:
+            self.dispute_sequence += 1
+            new_entries.append({
+                "id": f"dispute-{stamp}-{self.dispute_sequence}",
+                "namespace": namespace,
+                "penalty": penalty,
+                "reason": reason,
+                "status": "active",
+                "source": source_id,
+                "created": created
+            })
+        
         index = 1
-        target_entries = []
-        target_index = 1
         
-        while True:
-            asset_name = f"{self.namespace}:disputes-{index}"
-            asset = self.client.get_asset(asset_name)
+        while new_entries:
+            asset_name = f"disputes-{index}"
+            full_name = f"{self.namespace}:{asset_name}"
+            asset = self.client.get_asset(full_name)
             
-            if not asset:
-                target_index = index
-                break
-            
-            disputes_str = asset.get("disputes", "[]")
-            try:
-                entries = json.loads(disputes_str) if isinstance(disputes_str, str) else disputes_str
-            except json.JSONDecodeError:
-                entries = []
+            entries = []
+            if asset:
+                disputes_str = asset.get("disputes", "[]")
+                try:
+                    entries = json.loads(disputes_str) if isinstance(disputes_str, str) else disputes_str
+                except json.JSONDecodeError:
+                    entries = []
             
-            if len(entries) < self.max_entries:
-                target_entries = entries
-                target_index = index
-                break
+            room = self.max_entries - len(entries)
+            if room > 0:
+                entries.extend(new_entries[:room])
+                new_entries = new_entries[room:]
+                
+                # Write to blockchain
+                asset_data = {
+                    "distordia-type": "disputes-registry",
+                    "version": 1,
+                    "updated": datetime.utcnow().isoformat() + "Z",
+                    "disputes": json.dumps(entries)
+                }
+                
+                if asset:
+                    self.client.update_asset(full_name, asset_data)
+                else:
+                    self.client.create_asset(asset_name, asset_data)
             
             index += 1
-            target_index = index
+    
+    # -------------------------------------------------------------------------
+    # Leader Duties
+    # -------------------------------------------------------------------------
+    
+    def holds_lease(self) -> bool:
+        """Renew the leader lease before registry writes. False once it is lost."""
+        if self.coordination is None:
+            return True
         
-        # Add new dispute
-        dispute = {
-            "id": f"dispute-{int(time.time() * 1000)}",
-            "namespace": namespace,
-            "penalty": penalty,
-            "reason": reason,
-            "status": "active",
-            "source": source_id,
-            "created": datetime.utcnow().isoformat() + "Z"
-        }
-        target_entries.append(dispute)
+        if self.is_leader:
+            self.is_leader = self.coordination.acquire_lease(self.worker_id)
+            if not self.is_leader:
+                self.logger.warning("Leader lease lost - stopping registry writes")
         
-        # Write to blockchain
-        asset_name = f"disputes-{target_index}"
-        asset_data = {
-            "distordia-type": "disputes-registry",
-            "version": 1,
-            "updated": datetime.utcnow().isoformat() + "Z",
-            "disputes": json.dumps(target_entries)
-        }
+        return self.is_leader
+    
+    def apply_queued_decisions(self):
+        """Apply tier decisions sent by partition workers."""
+        decisions = self.coordination.take_decisions()
+        if not decisions:
+            return
         
-        full_name = f"{self.namespace}:{asset_name}"
-        if self.client.get_asset(full_name):
-            self.client.update_asset(full_name, asset_data)
-        else:
-            self.client.create_asset(asset_name, asset_data)
+        self.logger.info(f"Applying {len(decisions)} decisions from workers...")
+        
+        for decision in decisions:
+            # Dropped decisions are re-derived by their worker next cycle
+            if not self.holds_lease():
+                break
+            namespace = decision["namespace"]
+            try:
+                with self.tracer.span(namespace, "namespace", phase="decision",
+                                      worker=decision["worker"]):
+                    self.apply_queued_decision(decision)
+            except Exception as e:
+                self.logger.error(f"Failed to apply decision for {namespace}: {e}")
+    
+    def apply_remaining_decisions(self):
+        """Apply decisions still queued after every partition has finished a --once run."""
+        self.decided = set()
+        self.is_leader = self.coordination.acquire_lease(self.worker_id)
+        if not self.is_leader:
+            self.logger.warning("Leader lease is held by a running worker - leaving decisions queued")
+            return
+        
+        self.apply_queued_decisions()
+    
+    def apply_queued_decision(self, decision: dict):
+        """Re-check a worker's decision against the registry and apply it if still valid."""
+        namespace = decision["namespace"]
+        
+        # Decisions can be a full interval old; drop any the registry has moved past
+        if namespace in self.decided:
+            self.logger.info(f"Dropping decision for {namespace}: already decided this cycle")
+            return
+        
+        current_tier = self.get_current_tier(namespace)
+        if current_tier != decision["current_tier"]:
+            self.logger.info(
+                f"Dropping decision for {namespace}: tier is now {current_tier}, "
+                f"not {decision['current_tier']}"
+            )
+            return
+        
+        balance, eligible_tier = self.evaluate_namespace(namespace)
+        
+        tier_order = {"L0": 0, "L1": 1, "L2": 2, "L3": 3}
+        if tier_order.get(eligible_tier, 0) >= tier_order.get(current_tier, 0):
+            self.logger.info(f"Dropping decision for {namespace}: still eligible for {current_tier}")
+            return
+        
+        self.decided.add(namespace)
+        self.apply_tier_decision(namespace, current_tier, eligible_tier, balance)
     
     # -------------------------------------------------------------------------
     # Main Loop
     # -------------------------------------------------------------------------
     
     def run_once(self):
-        """Run a single processing cycle."""
-        self.logger.info("=" * 60)
-        self.logger.info("Starting verification cycle")
+        """Run a single processing cycle, with tracing and profiling if enabled."""
+        stem = f"cycle-{datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')}"
+        if self.workers > 1:
+            stem += f"-w{self.worker_index}"
         
-        # Process verification requests
-        self.process_verification_requests()
+        profiler = cProfile.Profile() if self.profile_dir else None
         
-        # Process dispute requests
-        self.process_dispute_requests()
+        try:
+            if profiler:
+                profiler.runcall(self.run_cycle)
+            else:
+                self.run_cycle()
+        finally:
+            self.client.end_cycle()
+            
+            # Slow cycles that fail are the interesting ones, so dump regardless
+            if profiler:
+                path = os.path.join(self.profile_dir, f"{stem}.pstats")
+                profiler.dump_stats(path)
+                self.logger.info(f"Profile written to {path}")
+            if self.trace_dir:
+                path = os.path.join(self.trace_dir, f"{stem}.trace.json")
+                self.tracer.save(path)
+                self.logger.info(f"Trace written to {path}")
+    
+    def run_cycle(self):
+        """Run the phases of a processing cycle."""
+        self.logger.info("=" * 60)
+        self.logger.info("Starting verification cycle")
         
-        # Audit existing verifications
-        self.audit_all_verified()
+        with self.tracer.span("cycle", "cycle", worker=self.worker_index):
+            if self.coordination is not None:
+                with self.tracer.span("lease", "phase"):
+                    self.is_leader = self.coordination.acquire_lease(self.worker_id)
+                self.logger.info(
+                    f"Partition {self.worker_index + 1}/{self.workers} "
+                    f"({'leader' if self.is_leader else 'worker'})"
+                )
+            
+            self.decided = set()
+            
+            if self.is_leader:
+                # Process verification and dispute requests
+                with self.tracer.span("requests", "phase"):
+                    self.process_pending_requests()
+            
+            # Audit existing verifications
+            with self.tracer.span("audit", "phase"):
+                self.audit_all_verified()
+            
+            # Take over from a departed leader, or renew, before applying worker decisions
+            if self.coordination is not None:
+                self.is_leader = self.coordination.acquire_lease(self.worker_id)
+            if self.coordination is not None and self.is_leader:
+                with self.tracer.span("worker-decisions", "phase"):
+                    self.apply_queued_decisions()
         
         self.logger.info("Cycle complete")
     
@@ -671,6 +1177,105 @@ def load_config(config_path: str) -> dict:
     return config
 
 
+def create_daemon(config: dict, session_id: Optional[str]) -> VerificationDaemon:
+    """Create a daemon, with a coordination store in partitioned mode."""
+    process_name = "verification-daemon"
+    if config["workers"] > 1:
+        process_name += f" worker {config['worker_index']}"
+    tracer = CycleTracer(enabled=bool(config["trace_dir"]), process_name=process_name)
+    
+    for directory in (config["trace_dir"], config["profile_dir"]):
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    
+    if config["replay_cassette"]:
+        client = ReplayNexusClient(config["replay_cassette"], config["replay_latency"], tracer)
+    elif config["record_cassette"]:
+        client = RecordingNexusClient(
+            config["node_url"], config["record_cassette"], session_id, tracer
+        )
+    else:
+        client = NexusClient(config["node_url"], session_id, tracer)
+    
+    coordination = None
+    if config["workers"] > 1:
+        coordination = CoordinationStore(config["coordination_db"], config["lease_ttl"])
+    
+    return VerificationDaemon(client, config, coordination, tracer)
+
+
+def shutdown_daemon(daemon: VerificationDaemon, elapsed: float):
+    """Release the lease, report API usage and close the client."""
+    logger = logging.getLogger(__name__)
+    
+    if daemon.coordination is not None:
+        daemon.coordination.release_lease(daemon.worker_id)
+    
+    # Call counts and wall time are what record/replay runs are compared on
+    client = daemon.client
+    if isinstance(client, (RecordingNexusClient, ReplayNexusClient)):
+        total = sum(client.call_counts.values())
+        logger.info(f"API calls: {total} in {elapsed:.2f}s")
+        for endpoint, count in sorted(client.call_counts.items()):
+            logger.info(f"  {endpoint}: {count}")
+        if isinstance(client, ReplayNexusClient):
+            logger.info(f"  not in cassette: {client.misses}")
+    
+    client.close()
+
+
+def run_worker(config: dict, session_id: Optional[str], once: bool):
+    """Run one partition worker. Entry point for spawned worker processes."""
+    logger = setup_logging(config["log_file"], config["log_level"], config["worker_index"])
+    daemon = create_daemon(config, session_id)
+    started = time.perf_counter()
+    
+    try:
+        if once:
+            daemon.run_once()
+        else:
+            daemon.run_forever(config["check_interval"])
+    except KeyboardInterrupt:
+        logger.info("Shutting down...")
+    finally:
+        shutdown_daemon(daemon, time.perf_counter() - started)
+
+
+def drain_decisions(config: dict, session_id: Optional[str]):
+    """Apply queued worker decisions once all partitions have finished."""
+    daemon = create_daemon(config, session_id)
+    started = time.perf_counter()
+    
+    try:
+        daemon.apply_remaining_decisions()
+    finally:
+        shutdown_daemon(daemon, time.perf_counter() - started)
+
+
+def spawn_workers(config: dict, session_id: Optional[str], once: bool):
+    """Run every partition as a local worker process."""
+    # Fresh interpreters, so each worker configures its own logging
+    context = multiprocessing.get_context("spawn")
+    
+    processes = []
+    for index in range(config["workers"]):
+        worker_config = dict(config, worker_index=index)
+        process = context.Process(
+            target=run_worker,
+            args=(worker_config, session_id, once),
+            name=f"worker-{index}"
+        )
+        process.start()
+        processes.append(process)
+    
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.join()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Distordia Verification Daemon",
@@ -685,6 +1290,22 @@ Examples:
 
   # Run once (no loop)
   python verification_daemon.py --once
+
+  # Run 4 partition workers on this host
+  python verification_daemon.py --config config.json --workers 4 --spawn
+
+  # Run partition 2 of 4 (one process per core)
+  python verification_daemon.py --config config.json --workers 4 --worker-index 2
+
+  # After separate --once partition runs have all finished, apply queued decisions
+  python verification_daemon.py --config config.json --workers 4 --drain
+
+  # Write a Chrome trace and a cProfile dump for each cycle
+  python verification_daemon.py --config config.json --trace traces --profile profiles
+
+  # Record one cycle's API traffic, then replay it offline with 20ms per call
+  python verification_daemon.py --config config.json --once --record cycle.jsonl.gz
+  python verification_daemon.py --config config.json --once --replay cycle.jsonl.gz --replay-latency 0.02
         """
     )
     
@@ -697,6 +1318,18 @@ Examples:
     parser.add_argument("--interval", "-i", type=int, help="Check interval in seconds")
     parser.add_argument("--once", action="store_true", help="Run once and exit")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose logging")
+    parser.add_argument("--workers", "-w", type=int, help="Number of audit partitions")
+    parser.add_argument("--worker-index", type=int, help="Partition owned by this process (0-based)")
+    parser.add_argument("--coordination-db", help="SQLite file for the leader lease and decision queue")
+    parser.add_argument("--spawn", action="store_true", help="Spawn all partitions as local processes")
+    parser.add_argument("--drain", action="store_true",
+                        help="Apply queued worker decisions and exit (after --once partition runs)")
+    parser.add_argument("--trace", metavar="DIR", help="Write a Chrome trace-event JSON file per cycle")
+    parser.add_argument("--profile", metavar="DIR", help="Write a cProfile pstats file per cycle")
+    parser.add_argument("--record", metavar="FILE", help="Record Nexus API traffic to a gzipped cassette")
+    parser.add_argument("--replay", metavar="FILE", help="Serve Nexus API calls from a cassette (no node)")
+    parser.add_argument("--replay-latency", type=float, metavar="SECONDS",
+                        help="Delay added to each replayed call")
     
     args = parser.parse_args()
     
@@ -710,38 +1343,84 @@ Examples:
         config["check_interval"] = args.interval
     if args.verbose:
         config["log_level"] = "DEBUG"
+    if args.workers:
+        config["workers"] = args.workers
+    if args.worker_index is not None:
+        config["worker_index"] = args.worker_index
+    if args.coordination_db:
+        config["coordination_db"] = args.coordination_db
+    if args.trace:
+        config["trace_dir"] = args.trace
+    if args.profile:
+        config["profile_dir"] = args.profile
+    if args.record:
+        config["record_cassette"] = args.record
+    if args.replay:
+        config["replay_cassette"] = args.replay
+    if args.replay_latency is not None:
+        config["replay_latency"] = args.replay_latency
+    
+    if not 0 <= config["worker_index"] < config["workers"]:
+        parser.error(f"--worker-index must be between 0 and {config['workers'] - 1}")
+    if args.drain and config["workers"] <= 1:
+        parser.error("--drain needs --workers greater than 1")
+    if config["record_cassette"] and config["replay_cassette"]:
+        parser.error("--record and --replay cannot be combined")
+    if args.spawn and (config["record_cassette"] or config["replay_cassette"]):
+        parser.error("--record and --replay need one cassette per process; run workers without --spawn")
     
     # Setup logging
-    logger = setup_logging(config["log_file"], config["log_level"])
+    worker_index = config["worker_index"] if config["workers"] > 1 and not args.spawn else None
+    logger = setup_logging(config["log_file"], config["log_level"], worker_index)
     
     logger.info("Distordia Verification Daemon starting...")
-    logger.info(f"Node: {config['node_url']}")
+    if config["replay_cassette"]:
+        logger.info(f"Replaying: {config['replay_cassette']}")
+    else:
+        logger.info(f"Node: {config['node_url']}")
     
     # Create client
     client = NexusClient(config["node_url"], args.session)
     
-    # Login if credentials provided
-    if args.username and args.password and args.pin:
+    # Login if credentials provided; replay needs no node and no session
+    replaying = bool(config["replay_cassette"])
+    if args.username and args.password and args.pin and not replaying:
         try:
             client.login(args.username, args.password, args.pin)
             client.unlock(args.pin)
         except NexusAPIError as e:
             logger.error(f"Login failed: {e}")
             sys.exit(1)
-    elif not args.session:
+    elif not args.session and not replaying:
         logger.warning("No session or credentials provided - write operations will fail")
     
+    if args.drain:
+        drain_decisions(config, client.session_id)
+        return
+    
+    # Spawned workers share the session created above
+    if args.spawn:
+        logger.info(f"Spawning {config['workers']} partition workers")
+        spawn_workers(config, client.session_id, args.once)
+        # Slower partitions queue decisions after the leader's last drain
+        if args.once:
+            drain_decisions(config, client.session_id)
+        return
+    
     # Create daemon
-    daemon = VerificationDaemon(client, config)
+    daemon = create_daemon(config, client.session_id)
+    started = time.perf_counter()
     
     # Run
-    if args.once:
-        daemon.run_once()
-    else:
-        try:
+    try:
+        if args.once:
+            daemon.run_once()
+        else:
             daemon.run_forever(config["check_interval"])
-        except KeyboardInterrupt:
-            logger.info("Shutting down...")
+    except KeyboardInterrupt:
+        logger.info("Shutting down...")
+    finally:
+        shutdown_daemon(daemon, time.perf_counter() - started)
 
 
 if __name__ == "__main__":